@@ -1,14 +1,125 @@
 """ブラウザ管理機能"""
 
 import os
+import asyncio
+import datetime
 import logging
 import platform
 import json
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 
+# Chrome起動引数（起動のたびにリストを組み立てないようモジュール定数にしておく）
+_BASE_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--disable-setuid-sandbox",
+    "--disable-notifications",
+    "--disable-geolocation",
+    "--disable-infobars",
+    "--window-size=1920,1080",
+    "--start-maximized",
+)
+
+# 既存プロファイル使用時の追加引数（Cloudflare回避対策）
+# --disable-features は最後に指定されたものしか有効にならないため1つにまとめる
+_PROFILE_CHROME_ARGS = _BASE_CHROME_ARGS + (
+    "--disable-web-security",
+    "--disable-features=IsolateOrigins,site-per-process",
+)
+
+_IGNORE_DEFAULT_ARGS = ["--enable-automation"]
+
+# bot検出回避スクリプト（新規ドキュメントごとにサイトのスクリプトより先に実行される）
+_STEALTH_JS = """
+    // navigator.webdriverを削除
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    
+    // ChromeDriverの痕跡を削除
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [
+            {
+                0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
+                description: "Portable Document Format", 
+                filename: "internal-pdf-viewer",
+                length: 1,
+                name: "Chrome PDF Plugin"
+            }
+        ]
+    });
+    
+    // 権限APIをオーバーライド
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+    
+    // Chrome固有のプロパティを追加
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+    
+    // タイムゾーンとロケールを設定
+    Object.defineProperty(navigator, 'language', {
+        get: () => 'ja-JP'
+    });
+    
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['ja-JP', 'ja', 'en-US', 'en']
+    });
+    
+    // WebGL Vendor/Rendererを実際のハードウェアに偽装
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(parameter) {
+        if (parameter === 37445) {
+            return 'Intel Inc.';
+        }
+        if (parameter === 37446) {
+            return 'Intel Iris OpenGL Engine';
+        }
+        return getParameter(parameter);
+    };
+    
+    // 画面解像度を設定
+    Object.defineProperty(screen, 'width', {
+        get: () => 1920
+    });
+    Object.defineProperty(screen, 'height', {
+        get: () => 1080
+    });
+    
+    // その他のナビゲータープロパティ
+    Object.defineProperty(navigator, 'hardwareConcurrency', {
+        get: () => 8
+    });
+    
+    Object.defineProperty(navigator, 'deviceMemory', {
+        get: () => 8
+    });
+    
+    // バックグラウンドのタブでも表示中として扱わせる
+    // （列ごとに開くページが非表示扱いで処理を止められないようにする）
+    Object.defineProperty(document, 'hidden', {
+        get: () => false
+    });
+    Object.defineProperty(document, 'visibilityState', {
+        get: () => 'visible'
+    });
+"""
+
+
 class BrowserManager:
     """ブラウザインスタンスの管理クラス
     
@@ -16,6 +127,12 @@ class BrowserManager:
     セッションを維持する機能を提供する。
     """
     
+    __slots__ = (
+        'playwright', 'browser', 'context', 'pages', 'temp_dir', 'logger',
+        'profile_name', 'chrome_user_data_dir', 'chrome_profile_path',
+        'available_profiles'
+    )
+    
     def __init__(self, use_profile: Optional[str] = None):
         """初期化
         
@@ -26,6 +143,7 @@ class BrowserManager:
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.pages: Dict[str, Page] = {}
+        self.temp_dir: Optional[str] = None
         self.logger = logging.getLogger("BrowserManager")
         
         # Chrome プロファイル設定
@@ -97,6 +215,55 @@ class BrowserManager:
         
         return profiles
 
+    def _get_temp_root(self, headless: bool) -> Optional[str]:
+        """一時プロファイルの作成先を決定
+        
+        ヘッドレス時はRAM上の /dev/shm（Linux）に置き、プロファイルの
+        コピー・Chromeの設定書き込み・終了時の削除をディスクから外す。
+        
+        Args:
+            headless (bool): ヘッドレスモードで起動するか
+            
+        Returns:
+            Optional[str]: 作成先ディレクトリ（Noneでシステム既定）
+        """
+        if headless and os.path.isdir("/dev/shm"):
+            return "/dev/shm"
+        return None
+
+    def _create_temp_profile(self, target_profile_dir: str, headless: bool) -> Tuple[str, str]:
+        """元のプロファイルから必要なファイルだけを一時ディレクトリにコピー
+        
+        Args:
+            target_profile_dir (str): コピー元のプロファイルディレクトリ
+            headless (bool): ヘッドレスモードで起動するか
+            
+        Returns:
+            Tuple[str, str]: (一時ユーザーデータディレクトリ, 一時プロファイルディレクトリ)
+        """
+        temp_dir = tempfile.mkdtemp(prefix="chrome_temp_", dir=self._get_temp_root(headless))
+        temp_profile_dir = os.path.join(temp_dir, os.path.basename(target_profile_dir))
+        
+        # 必要なファイルのみコピー（Cookie、LocalStorage等）
+        important_files = [
+            'Cookies', 'Cookies-journal',
+            'Local Storage', 'Session Storage',
+            'Web Data', 'Login Data',
+            'Preferences'
+        ]
+        
+        os.makedirs(temp_profile_dir, exist_ok=True)
+        for file_name in important_files:
+            src = os.path.join(target_profile_dir, file_name)
+            dst = os.path.join(temp_profile_dir, file_name)
+            if os.path.exists(src):
+                if os.path.isdir(src):
+                    shutil.copytree(src, dst, dirs_exist_ok=True)
+                else:
+                    shutil.copy2(src, dst)
+        
+        return temp_dir, temp_profile_dir
+
     async def start_browser(self, headless: bool = False, use_existing_profile: bool = True, 
                           profile_dir: Optional[str] = None) -> bool:
         """ブラウザを起動
@@ -123,79 +290,42 @@ class BrowserManager:
                 self.logger.info(f"既存のChromeプロファイルを使用: {target_profile_dir}")
                 
                 # 一時的なユーザーデータディレクトリを作成（元のプロファイルを保護）
-                import tempfile
-                import shutil
-                
-                temp_dir = tempfile.mkdtemp(prefix="chrome_temp_")
-                temp_profile_dir = os.path.join(temp_dir, os.path.basename(target_profile_dir))
-                
-                # 必要なファイルのみコピー（Cookie、LocalStorage等）
-                important_files = [
-                    'Cookies', 'Cookies-journal',
-                    'Local Storage', 'Session Storage',
-                    'Web Data', 'Login Data',
-                    'Preferences'
-                ]
-                
-                os.makedirs(temp_profile_dir, exist_ok=True)
-                for file_name in important_files:
-                    src = os.path.join(target_profile_dir, file_name)
-                    dst = os.path.join(temp_profile_dir, file_name)
-                    if os.path.exists(src):
-                        if os.path.isdir(src):
-                            shutil.copytree(src, dst, dirs_exist_ok=True)
-                        else:
-                            shutil.copy2(src, dst)
+                # ファイルコピーはイベントループを塞がないよう別スレッドで行う
+                temp_dir, temp_profile_dir = await asyncio.to_thread(
+                    self._create_temp_profile, target_profile_dir, headless
+                )
+                # 一時ディレクトリのパスを保存（起動失敗時もクリーンアップできるよう先に保持）
+                self.temp_dir = temp_dir
                 
                 # ブラウザ起動オプション（Cloudflare回避対策を強化）
-                launch_args = [
-                    "--no-sandbox",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-web-security",
-                    "--disable-features=IsolateOrigins,site-per-process",
-                    "--disable-dev-shm-usage",
-                    "--disable-setuid-sandbox",
-                    "--disable-notifications",
-                    "--disable-geolocation",
-                    "--disable-infobars",
-                    "--window-size=1920,1080",
-                    "--start-maximized",
-                    "--disable-blink-features=AutomationControlled",
-                    "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                    f"--user-data-dir={temp_dir}",
+                # User-Agentはコンテキスト側で指定するため起動引数には含めない
+                launch_args = list(_PROFILE_CHROME_ARGS) + [
                     f"--profile-directory={os.path.basename(temp_profile_dir)}"
                 ]
+                if headless:
+                    # ヘッドレス時はディスクキャッシュを実質無効化してI/Oを減らす
+                    launch_args.append("--disk-cache-size=1")
                 
-                self.browser = await self.playwright.chromium.launch(
+                # ユーザーデータディレクトリ付きの起動とコンテキスト作成を1回で行う
+                # （launch + new_context だと使われない既定コンテキストが残る）
+                self.context = await self.playwright.chromium.launch_persistent_context(
+                    temp_dir,
                     headless=headless,
                     args=launch_args,
-                    ignore_default_args=["--enable-automation"]
-                )
-                self.context = await self.browser.new_context(
+                    ignore_default_args=_IGNORE_DEFAULT_ARGS,
                     viewport={'width': 1280, 'height': 720},
                     user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
                 )
-                
-                # 一時ディレクトリのパスを保存（クリーンアップ用）
-                self.temp_dir = temp_dir
+                # 永続コンテキストではNoneが返る（終了はコンテキストを閉じれば完了する）
+                self.browser = self.context.browser
                 
             else:
                 # 新しいブラウザインスタンスを作成
                 self.logger.info("新しいブラウザインスタンスを作成")
                 self.browser = await self.playwright.chromium.launch(
                     headless=headless,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-blink-features=AutomationControlled",
-                        "--disable-dev-shm-usage",
-                        "--disable-setuid-sandbox",
-                        "--disable-notifications",
-                        "--disable-geolocation",
-                        "--disable-infobars",
-                        "--window-size=1920,1080",
-                        "--start-maximized"
-                    ],
-                    ignore_default_args=["--enable-automation"]
+                    args=list(_BASE_CHROME_ARGS),
+                    ignore_default_args=_IGNORE_DEFAULT_ARGS
                 )
                 self.context = await self.browser.new_context(
                     viewport={'width': 1920, 'height': 1080},
@@ -204,80 +334,8 @@ class BrowserManager:
                     timezone_id='Asia/Tokyo'
                 )
             
-            # JavaScript実行でbot検出回避を強化
-            await self.context.add_init_script("""
-                // navigator.webdriverを削除
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // ChromeDriverの痕跡を削除
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [
-                        {
-                            0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
-                            description: "Portable Document Format", 
-                            filename: "internal-pdf-viewer",
-                            length: 1,
-                            name: "Chrome PDF Plugin"
-                        }
-                    ]
-                });
-                
-                // 権限APIをオーバーライド
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-                
-                // Chrome固有のプロパティを追加
-                window.chrome = {
-                    runtime: {},
-                    loadTimes: function() {},
-                    csi: function() {},
-                    app: {}
-                };
-                
-                // タイムゾーンとロケールを設定
-                Object.defineProperty(navigator, 'language', {
-                    get: () => 'ja-JP'
-                });
-                
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['ja-JP', 'ja', 'en-US', 'en']
-                });
-                
-                // WebGL Vendor/Rendererを実際のハードウェアに偽装
-                const getParameter = WebGLRenderingContext.prototype.getParameter;
-                WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                    if (parameter === 37445) {
-                        return 'Intel Inc.';
-                    }
-                    if (parameter === 37446) {
-                        return 'Intel Iris OpenGL Engine';
-                    }
-                    return getParameter(parameter);
-                };
-                
-                // 画面解像度を設定
-                Object.defineProperty(screen, 'width', {
-                    get: () => 1920
-                });
-                Object.defineProperty(screen, 'height', {
-                    get: () => 1080
-                });
-                
-                // その他のナビゲータープロパティ
-                Object.defineProperty(navigator, 'hardwareConcurrency', {
-                    get: () => 8
-                });
-                
-                Object.defineProperty(navigator, 'deviceMemory', {
-                    get: () => 8
-                });
-            """)
+            # bot検出回避スクリプトをコンテキストに一度だけ登録
+            await self.context.add_init_script(_STEALTH_JS)
             
             self.logger.info("ブラウザ起動完了")
             return True
@@ -309,7 +367,7 @@ class BrowserManager:
             if url:
                 await page.goto(url, wait_until="domcontentloaded", timeout=30000)
                 
-            self.logger.info(f"ページ作成完了: {page_name}")
+            self.logger.info("ページ作成完了: %s", page_name)
             return page
             
         except Exception as e:
@@ -414,7 +472,6 @@ class BrowserManager:
                 return ""
                 
             if not filename:
-                import datetime
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"screenshot_{page_name}_{timestamp}.png"
             
@@ -429,26 +486,23 @@ class BrowserManager:
     async def cleanup(self):
         """リソースのクリーンアップ"""
         try:
-            # 全ページを閉じる
-            for page_name in list(self.pages.keys()):
-                await self.close_page(page_name)
-            
-            # ブラウザを閉じる
+            # コンテキストを閉じる（配下のページもまとめて閉じられる）
             if self.context:
                 await self.context.close()
+            self.pages.clear()
+            
+            # ブラウザを閉じる
             if self.browser:
                 await self.browser.close()
             if self.playwright:
                 await self.playwright.stop()
             
             # 一時ディレクトリを削除
-            if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-                import shutil
-                try:
-                    shutil.rmtree(self.temp_dir)
-                    self.logger.info(f"一時ディレクトリを削除: {self.temp_dir}")
-                except Exception as e:
-                    self.logger.warning(f"一時ディレクトリ削除エラー: {e}")
+            # （大量の小さなファイルを消すため別スレッドで実行する）
+            if self.temp_dir and os.path.exists(self.temp_dir):
+                await asyncio.to_thread(shutil.rmtree, self.temp_dir, True)
+                self.logger.info(f"一時ディレクトリを削除: {self.temp_dir}")
+                self.temp_dir = None
                 
             self.logger.info("ブラウザマネージャーのクリーンアップ完了")
             
@@ -462,9 +516,9 @@ class BrowserManager:
             Dict[str, Any]: 現在の状態情報
         """
         return {
-            "browser_running": self.browser is not None,
+            "browser_running": self.browser is not None or self.context is not None,
             "context_available": self.context is not None,
-            "active_pages": list(self.pages.keys()),
+            "active_pages": tuple(self.pages),
             "chrome_user_data_dir": self.chrome_user_data_dir,
             "chrome_profile_path": self.chrome_profile_path,
             "current_profile": self.profile_name,
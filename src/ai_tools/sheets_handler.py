@@ -22,6 +22,12 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 「コピー」列の判定パターン（「コピー」「copy」「ｺﾋﾟｰ」を含むセル）
+_COPY_COLUMN_PATTERN = re.compile(r'コピー|copy|ｺﾋﾟｰ')
+
+# 1列目〜26列目（A〜Z）の列文字
+_SINGLE_COLUMN_LETTERS = tuple(chr(ord('A') + i) for i in range(26))
+
 class SheetsHandler:
     """Google Sheets操作を管理するクラス"""
     
@@ -312,10 +318,15 @@ class SheetsHandler:
             raise
 
     @retry_on_api_error(max_retries=3)
-    def analyze_sheet_structure(self) -> Dict[str, Any]:
+    def analyze_sheet_structure(self, start_row: Optional[int] = None,
+                                end_row: Optional[int] = None) -> Dict[str, Any]:
         """
         シート構造を分析（CLAUDE.md要件に基づく）
         
+        Args:
+            start_row: 処理対象とする最初の行番号（Noneの場合はデータ開始行から）
+            end_row: 処理対象とする最後の行番号（Noneの場合は最終行まで）
+            
         Returns:
             Dict: 分析結果
         """
@@ -337,9 +348,8 @@ class SheetsHandler:
             # 「コピー」列を検索（より柔軟な検索）
             copy_columns = []
             for col_index, cell_value in enumerate(work_row_values):
-                cell_str = str(cell_value).strip().lower()
                 # 「コピー」「copy」「コピー列」など様々なパターンに対応
-                if any(keyword in cell_str for keyword in ['コピー', 'copy', 'ｺﾋﾟｰ']):
+                if _COPY_COLUMN_PATTERN.search(str(cell_value).lower()):
                     col_letter = self._column_index_to_letter(col_index + 1)
                     copy_columns.append({
                         'column_letter': col_letter,
@@ -363,23 +373,27 @@ class SheetsHandler:
             # データ開始行を検索
             data_start_row = self.find_data_start_row()
             
-            # A列の処理対象行を検索（データ開始行から）
-            a_column_range = f"{self.sheet_name}!A{data_start_row}:A"
-            a_column_result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=a_column_range
-            ).execute()
-            
-            a_column_values = a_column_result.get('values', [])
-            
-            # 連続した数値が入っている行を特定
+            # A列の処理対象行を検索（データ開始行と開始行の後の方から、終了行の指定があればそこまでだけ取得）
+            first_row = max(start_row or 0, data_start_row)
             target_rows = []
-            for row_index, row_data in enumerate(a_column_values):
-                if row_data and str(row_data[0]).strip().isdigit():
-                    target_rows.append(data_start_row + row_index)  # 実際の行番号
-                else:
-                    # 空白セルまたは数値以外で終了
-                    break
+            if not end_row or end_row >= first_row:
+                a_column_range = f"{self.sheet_name}!A{first_row}:A{end_row or ''}"
+                a_column_result = self.service.spreadsheets().values().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=a_column_range
+                ).execute()
+                
+                a_column_values = a_column_result.get('values', [])
+                
+                # 連続した数値が入っている行を特定
+                for row_index, row_data in enumerate(a_column_values):
+                    if row_data and str(row_data[0]).strip().isdigit():
+                        target_rows.append(first_row + row_index)  # 実際の行番号
+                    else:
+                        # 空白セルまたは数値以外で終了
+                        break
+            else:
+                logger.info(f"終了行（{end_row}）が検索開始行（{first_row}）より前のため処理対象行はありません")
             
             structure = {
                 'copy_columns': copy_columns,
@@ -542,6 +556,10 @@ class SheetsHandler:
         Returns:
             str: 列文字（A, B, C, ..., AA, AB, ...）
         """
+        # A〜Zは事前計算済みの表から返す
+        if 0 < column_index <= 26:
+            return _SINGLE_COLUMN_LETTERS[column_index - 1]
+        
         result = ""
         while column_index > 0:
             column_index -= 1
@@ -4,24 +4,31 @@ Cloudflare回避・AIサービス自動ログイン専用マネージャー
 """
 
 import os
+import re
 import json
 import logging
 import asyncio
 import random
 import time
-from typing import Optional, Dict, Any, List, Callable, Union
+from typing import Optional, Dict, Any, List, Callable, Union, Tuple
 from pathlib import Path
 import tempfile
 import shutil
 from datetime import datetime, timedelta
 
 from playwright.async_api import (
-    async_playwright, Browser, BrowserContext, Page, Playwright,
+    async_playwright, Browser, BrowserContext, CDPSession, Page, Playwright,
     TimeoutError as PlaywrightTimeoutError
 )
 
 logger = logging.getLogger(__name__)
 
+# Cloudflareチャレンジ由来のコンソール出力（大量に出るためログ対象外にする）
+_CF_CONSOLE_RE = re.compile(r'cloudflare|challenge|turnstile', re.IGNORECASE)
+
+# ページタイトル・URLからチャレンジページを判定するキーワード
+_CF_PAGE_RE = re.compile(r'cloudflare|challenge|checking', re.IGNORECASE)
+
 
 class CloudflareBypassManager:
     """
@@ -75,6 +82,11 @@ class CloudflareBypassManager:
         # パフォーマンス最適化設定
         self.performance_config = self._get_performance_config()
         
+        # 人間らしい動作のシミュレーション用（最後のマウス座標）
+        self._last_mouse_position: Tuple[float, float] = (0, 0)
+        # マウス操作用のCDPセッション（ページごとに1つを使い回し、ページが閉じたら破棄）
+        self._cdp_sessions: Dict[Page, CDPSession] = {}
+        
         # ステルス設定
         self.stealth_config = self._get_stealth_config()
         
@@ -452,20 +464,20 @@ class CloudflareBypassManager:
             
             # URLが指定されている場合はナビゲート
             if url:
-                logger.info(f"Navigating to {url}...")
+                logger.info("Navigating to %s...", url)
                 success = await self.safe_goto(page, url)
                 if not success:
-                    logger.error(f"Failed to navigate to {url}")
+                    logger.error("Failed to navigate to %s", url)
                     await page.close()
                     return None
-                logger.info(f"Successfully navigated to {url}")
+                logger.info("Successfully navigated to %s", url)
             else:
                 logger.info("No URL specified, page created with blank page")
             
             # ページを保存
             self.pages[service_name] = page
             
-            logger.info(f"Stealth page created for {service_name}")
+            logger.info("Stealth page created for %s", service_name)
             return page
             
         except Exception as e:
@@ -477,20 +489,24 @@ class CloudflareBypassManager:
         ページレベルのイベントハンドラーを設定
         """
         def handle_page_error(error):
-            logger.error(f"Page error in {service_name}: {error}")
+            logger.error("Page error in %s: %s", service_name, error)
         
         def handle_console_message(msg):
-            if msg.type in ['error', 'warning']:
-                logger.warning(f"Console {msg.type} in {service_name}: {msg.text}")
+            msg_type = msg.type
+            if msg_type in ('error', 'warning'):
+                text = msg.text
+                if _CF_CONSOLE_RE.search(text):
+                    return
+                logger.warning("Console %s in %s: %s", msg_type, service_name, text)
             elif self.debug_mode:
-                logger.debug(f"Console {msg.type} in {service_name}: {msg.text}")
+                logger.debug("Console %s in %s: %s", msg_type, service_name, msg.text)
         
         def handle_request_failed(request):
-            logger.warning(f"Request failed in {service_name}: {request.url}")
+            logger.warning("Request failed in %s: %s", service_name, request.url)
         
         def handle_response(response):
             if response.status >= 400:
-                logger.warning(f"HTTP {response.status} in {service_name}: {response.url}")
+                logger.warning("HTTP %s in %s: %s", response.status, service_name, response.url)
         
         # イベントハンドラーを登録
         page.on("pageerror", handle_page_error)
@@ -522,7 +538,7 @@ class CloudflareBypassManager:
             
             # Cloudflareチャレンジページかどうかを確認
             if await self._is_cloudflare_challenge(page):
-                logger.info(f"Cloudflare challenge detected on {url}")
+                logger.info("Cloudflare challenge detected on %s", url)
                 await self._handle_cloudflare_challenge(page)
             
             # レスポンスステータスを確認
@@ -560,10 +576,7 @@ class CloudflareBypassManager:
             title = await page.title()
             url = page.url
             
-            if ("cloudflare" in title.lower() or 
-                "challenge" in title.lower() or
-                "checking" in title.lower() or
-                "challenge" in url.lower()):
+            if _CF_PAGE_RE.search(title) or 'challenge' in url.lower():
                 return True
             
             return False
@@ -598,7 +611,7 @@ class CloudflareBypassManager:
                 await self._simulate_human_behavior(page)
                 
             except Exception as e:
-                logger.error(f"Error during Cloudflare challenge: {e}")
+                logger.error("Error during Cloudflare challenge: %s", e)
                 break
         
         logger.warning("Cloudflare challenge timeout")
@@ -608,22 +621,104 @@ class CloudflareBypassManager:
         """
         人間らしい動作をシミュレート
         """
+        # チャレンジ待機中に繰り返し呼ばれるため属性参照をローカルに束縛
+        randint = random.randint
+        uniform = random.uniform
         try:
-            # ランダムなマウス移動
+            # ランダムな曲線軌跡でマウス移動
             viewport = page.viewport_size
             if viewport:
-                x = random.randint(100, viewport['width'] - 100)
-                y = random.randint(100, viewport['height'] - 100)
-                await page.mouse.move(x, y)
-                await asyncio.sleep(random.uniform(0.1, 0.3))
+                x = randint(100, viewport['width'] - 100)
+                y = randint(100, viewport['height'] - 100)
+                trajectory = self._build_mouse_trajectory(
+                    self._last_mouse_position, (x, y), randint(10, 30)
+                )
+                await self._dispatch_mouse_trajectory(page, trajectory)
+                self._last_mouse_position = (x, y)
+                await asyncio.sleep(uniform(0.1, 0.3))
             
             # ランダムなスクロール
-            scroll_delta = random.randint(-100, 100)
+            scroll_delta = randint(-100, 100)
             await page.mouse.wheel(0, scroll_delta)
-            await asyncio.sleep(random.uniform(0.2, 0.5))
+            await asyncio.sleep(uniform(0.2, 0.5))
             
         except Exception as e:
-            logger.debug(f"Error simulating human behavior: {e}")
+            logger.debug("Error simulating human behavior: %s", e)
+    
+    @staticmethod
+    def _build_mouse_trajectory(
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        steps: int
+    ) -> List[Tuple[float, float]]:
+        """
+        2次ベジェ曲線でマウスの移動軌跡を事前計算
+        
+        Args:
+            start: 開始座標
+            end: 終了座標
+            steps: 分割数
+            
+        Returns:
+            軌跡の座標リスト（終点を含む）
+        """
+        (x0, y0), (x2, y2) = start, end
+        # 制御点を中点の周辺にずらして直線的な動きを避ける
+        x1 = (x0 + x2) / 2 + random.uniform(-100, 100)
+        y1 = (y0 + y2) / 2 + random.uniform(-100, 100)
+        
+        points = []
+        for i in range(1, steps + 1):
+            t = i / steps
+            u = 1 - t
+            points.append((
+                u * u * x0 + 2 * u * t * x1 + t * t * x2,
+                u * u * y0 + 2 * u * t * y1 + t * t * y2
+            ))
+        return points
+    
+    async def _get_cdp_session(self, page: Page) -> CDPSession:
+        """
+        ページのCDPセッションを取得（初回のみ作成し、ページが閉じたら破棄する）
+        
+        Args:
+            page: 対象のページ
+            
+        Returns:
+            ページに接続済みのCDPセッション
+        """
+        cdp = self._cdp_sessions.get(page)
+        if cdp is None:
+            cdp = await page.context.new_cdp_session(page)
+            self._cdp_sessions[page] = cdp
+            page.once("close", lambda _: self._cdp_sessions.pop(page, None))
+        return cdp
+    
+    async def _dispatch_mouse_trajectory(
+        self,
+        page: Page,
+        trajectory: List[Tuple[float, float]]
+    ):
+        """
+        マウス移動イベントをページのCDPセッションから軌跡の順に送信
+        
+        各点の間に短い間隔を空け、軌跡どおりの順序と速さで届くようにする。
+        セッションはページごとに使い回すため、呼び出しのたびに作成しない。
+        """
+        cdp = await self._get_cdp_session(page)
+        uniform = random.uniform
+        try:
+            for x, y in trajectory:
+                await cdp.send('Input.dispatchMouseEvent', {'type': 'mouseMoved', 'x': x, 'y': y})
+                await asyncio.sleep(uniform(0.005, 0.02))
+        except Exception:
+            # 使えなくなったセッションは切断して破棄し、次回作り直す
+            if self._cdp_sessions.pop(page, None) is not None:
+                try:
+                    await cdp.detach()
+                except Exception:
+                    pass
+            raise
     
     async def _execute_with_retry(
         self,
@@ -732,19 +827,19 @@ class CloudflareBypassManager:
             for service_name in self.contexts.keys():
                 await self.save_session(service_name)
             
-            # ページを閉じる
-            for page in self.pages.values():
-                try:
-                    await page.close()
-                except:
-                    pass
+            # マウス操作用のCDPセッションを切断
+            await asyncio.gather(
+                *(cdp.detach() for cdp in self._cdp_sessions.values()),
+                return_exceptions=True
+            )
+            self._cdp_sessions.clear()
             
-            # コンテキストを閉じる
-            for context in self.contexts.values():
-                try:
-                    await context.close()
-                except:
-                    pass
+            # コンテキストをまとめて閉じる（配下のページも閉じられる）
+            await asyncio.gather(
+                *(context.close() for context in self.contexts.values()),
+                return_exceptions=True
+            )
+            self.pages.clear()
             
             # ブラウザを閉じる
             if self.browser:
@@ -755,11 +850,12 @@ class CloudflareBypassManager:
                 await self.playwright.stop()
             
             # 一時ディレクトリを削除
-            for temp_dir in self.temp_dirs:
-                try:
-                    shutil.rmtree(temp_dir)
-                except:
-                    pass
+            # （大量の小さなファイルを消すため別スレッドでまとめて実行する）
+            await asyncio.gather(*(
+                asyncio.to_thread(shutil.rmtree, temp_dir, True)
+                for temp_dir in self.temp_dirs
+            ))
+            self.temp_dirs.clear()
             
             logger.info("Cleanup completed")
             
@@ -3,6 +3,7 @@
 import os
 import logging
 import asyncio
+import platform
 from typing import Optional, Dict, Any, List, Callable
 from pathlib import Path
 import tempfile
@@ -102,8 +103,6 @@ class EnhancedBrowserManager:
     
     def _get_chrome_profile_path(self) -> Optional[str]:
         """Chromeプロファイルのパスを取得"""
-        import platform
-        
         system = platform.system()
         home = os.path.expanduser("~")
         
@@ -288,7 +287,7 @@ class EnhancedBrowserManager:
             page = await context.new_page()
             
             # エラーハンドリング
-            page.on("pageerror", lambda e: logger.error(f"Page error in {service_name}: {e}"))
+            page.on("pageerror", lambda e: logger.error("Page error in %s: %s", service_name, e))
             page.on("console", lambda msg: self._handle_console_message(service_name, msg))
             
             # URLが指定されている場合はナビゲート
@@ -310,7 +309,7 @@ class EnhancedBrowserManager:
         text = msg.text
         
         if msg_type in ['error', 'warning']:
-            logger.warning(f"Console {msg_type} in {service_name}: {text}")
+            logger.warning("Console %s in %s: %s", msg_type, service_name, text)
     
     async def safe_goto(
         self,
@@ -65,6 +65,7 @@ class SimpleBrowserManager:
     
     async def create_page(self, name: str, url: Optional[str] = None) -> Optional[Page]:
         """ページを作成"""
+        page = None
         try:
             if not self.context:
                 logger.error("Browser context not initialized")
@@ -74,24 +75,52 @@ class SimpleBrowserManager:
             self.pages[name] = page
             
             if url:
-                logger.info(f"Navigating to {url}")
+                logger.info("Navigating to %s", url)
                 await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                logger.info(f"Successfully loaded {url}")
+                logger.info("Successfully loaded %s", url)
                 
             return page
             
         except Exception as e:
             logger.error(f"Failed to create page: {e}")
+            # 読み込みに失敗したページは呼び出し側に返らないため、ここで閉じて登録も外す
+            if page is not None:
+                await self.close_page(name, page)
             return None
     
+    async def get_or_create_page(self, name: str, url: Optional[str] = None) -> Optional[Page]:
+        """同名のページが開いていれば再利用し、なければ作成"""
+        page = self.pages.get(name)
+        if page is None or page.is_closed():
+            return await self.create_page(name, url)
+        
+        try:
+            await page.bring_to_front()
+            if url:
+                logger.info("Reusing page %s, navigating to %s", name, url)
+                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            return page
+        except Exception as e:
+            logger.error(f"Failed to reuse page: {e}")
+            return None
+    
+    async def close_page(self, name: str, page: Page):
+        """ページを閉じる（同名で登録されているのがこのページなら登録も外す）"""
+        if self.pages.get(name) is page:
+            del self.pages[name]
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.warning(f"Failed to close page: {e}")
+    
     async def cleanup(self):
         """リソースをクリーンアップ"""
         try:
-            for page in self.pages.values():
-                await page.close()
-                
+            # コンテキストを閉じれば配下のページも閉じられる
             if self.context:
                 await self.context.close()
+            self.pages.clear()
                 
             if self.browser:
                 await self.browser.close()
@@ -10,14 +10,130 @@
 JSON形式でファイルに永続化し、次回起動時に復元する機能を提供
 """
 
+import atexit
+import hashlib
 import json
 import os
+import threading
+from types import MappingProxyType
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional, Tuple
 from src.utils.logger import get_logger
 
+try:
+    import orjson  # 高速なJSONライブラリ（未インストール時は標準のjsonを使用）
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
+# auto_save の連続呼び出しをまとめる待機時間（秒）
+AUTO_SAVE_DELAY = 0.25
+
+# 値のキャッシュに使う「未登録」マーカー
+_MISSING = object()
+
+# セクションが存在しない場合に返す共有の空マッピング（読み取り専用）
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
+
+# JSONの読み書き関数（orjsonの有無に応じてimport時に1回だけ選ぶ）
+if orjson is not None:
+    _ORJSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def _json_loads(data: bytes) -> Any:
+        """JSONバイト列を読み込む"""
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        """インデント付きのUTF-8 JSONバイト列に変換する"""
+        return orjson.dumps(obj, option=_ORJSON_DUMP_OPTIONS)
+else:
+    def _json_loads(data: bytes) -> Any:
+        """JSONバイト列を読み込む"""
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        """インデント付きのUTF-8 JSONバイト列に変換する"""
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+# デフォルト設定のテンプレート
+# 辞書を毎回組み立てずに済むよう、読み込み時に一度だけJSONバイト列へ変換しておく
+_DEFAULT_CONFIG_BYTES = json.dumps({
+    "ui": {
+        "window_width": 1200,
+        "window_height": 800,
+        "window_x": -1,  # -1は中央配置を意味
+        "window_y": -1,
+        "theme": "default",
+        "font_size": 10,
+        "log_lines": 100
+    },
+    "spreadsheet": {
+        "last_url": "",
+        "last_sheet": "",
+        "auto_load": False
+    },
+    "ai_settings": {
+        "ChatGPT": {
+            "enabled": False,
+            "model": "gpt-4o",
+            "settings": {
+                "temperature": 0.7,
+                "max_tokens": 2000
+            }
+        },
+        "Claude": {
+            "enabled": False,
+            "model": "claude-3-5-sonnet-20241022",
+            "settings": {
+                "max_tokens": 4000
+            }
+        },
+        "Gemini": {
+            "enabled": False,
+            "model": "gemini-2.0-flash-exp",
+            "settings": {
+                "temperature": 0.9,
+                "max_output_tokens": 2048
+            }
+        },
+        "Genspark": {
+            "enabled": False,
+            "model": "genspark-latest",
+            "settings": {}
+        },
+        "Google AI Studio": {
+            "enabled": False,
+            "model": "gemini-2.0-flash-exp",
+            "settings": {
+                "temperature": 0.9,
+                "max_output_tokens": 2048,
+                "safety_settings": "moderate"
+            }
+        }
+    },
+    "processing": {
+        "retry_count": 5,
+        "retry_delay": 10,
+        "timeout": 300,
+        "parallel_processing": False
+    },
+    "logging": {
+        "level": "INFO",
+        "max_log_files": 10,
+        "max_log_size_mb": 10
+    }
+}, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """ドット記法のキーを分割する（同じキーの分割結果は再利用する）"""
+    return tuple(key.split('.'))
+
 
 class ConfigManager:
     """アプリケーション設定の管理クラス"""
@@ -30,153 +146,190 @@ class ConfigManager:
             config_file: 設定ファイルのパス
         """
         self.config_file = Path(config_file)
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        self.config_data: Dict[str, Any] = {}
-        self.load_config()
+        # 設定ファイルは最初に設定へアクセスした時点で読み込む（config_data参照）
+        self._config_data: Optional[Dict[str, Any]] = None
+        
+        # 保存制御（auto_saveのデバウンスと重複書き込みの抑止）
+        self._save_lock = threading.RLock()
+        self._auto_save_timer: Optional[threading.Timer] = None
+        self._last_saved_hash: Optional[bytes] = None
+        # 終了時に保留中の自動保存を書き込む（デバウンス中の変更を失わないため）
+        atexit.register(self.flush)
+        # 前回の保存・読み込み以降に設定が変更されたかどうか
+        self._dirty = False
+        # 最後に読み込み・保存した時点の設定ファイルの更新時刻
+        self._last_mtime_ns: Optional[int] = None
+        
+        # ドット記法キー → 途中の階層の辞書 の平坦化インデックス
+        # 階層が変わる変更時はNoneにして破棄し、次の読み取り時に作り直す
+        self._flat: Optional[Dict[str, Any]] = None
+    
+    @property
+    def config_data(self) -> Dict[str, Any]:
+        """
+        設定辞書（未読み込みならここで設定ファイルを読み込む）
+        
+        内部で使う実体のため読み取り専用として扱い、変更は set_config や
+        set_*_config で行う（直接書き換えると平坦化インデックスと食い違う）。
+        """
+        data = self._config_data
+        if data is None:
+            with self._save_lock:
+                if self._config_data is None:
+                    self.load_config()
+                data = self._config_data
+        return data
+    
+    @config_data.setter
+    def config_data(self, value: Dict[str, Any]):
+        # 辞書ごと差し替えた場合は古い階層を指すインデックスを破棄する
+        self._config_data = value
+        self._flat = None
     
     def load_config(self) -> bool:
         """
         設定ファイルを読み込む
         
+        前回の読み込み・保存以降にファイルの更新時刻が変わっておらず、
+        未保存の変更もない場合は読み直さない。
+        
         Returns:
             bool: 読み込み成功時True
         """
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config_data = json.load(f)
-                # デフォルト設定とマージ（新しい項目が追加された場合に対応）
-                default_config = self._get_default_config()
-                self._merge_config(default_config, self.config_data)
-                self.config_data = default_config
-                logger.info(f"設定ファイルを読み込みました: {self.config_file}")
+            try:
+                mtime_ns = self.config_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+            
+            if mtime_ns is not None:
+                if (mtime_ns == self._last_mtime_ns and not self._dirty
+                        and self._config_data is not None):
+                    logger.debug("設定ファイルに変更がないため読み込みをスキップしました")
+                    return True
+                
+                saved_config = _json_loads(self.config_file.read_bytes())
+                # デフォルト設定へその場でマージ（新しい項目が追加された場合に対応）
+                config_data = self._get_default_config()
+                self._merge_config(config_data, saved_config)
+                self.config_data = config_data
+                self._flat = None
+                self._dirty = False
+                self._last_mtime_ns = mtime_ns
+                logger.info("設定ファイルを読み込みました: {}", self.config_file)
             else:
                 # デフォルト設定で初期化
                 self.config_data = self._get_default_config()
+                self._mark_changed()
                 logger.info("デフォルト設定で初期化しました")
             return True
             
         except Exception as e:
-            logger.error(f"設定ファイルの読み込みに失敗: {e}")
+            logger.error("設定ファイルの読み込みに失敗: {}", e)
             self.config_data = self._get_default_config()
+            self._mark_changed()
             return False
     
     def save_config(self) -> bool:
         """
         設定ファイルに保存
         
+        一時ファイルに書き出してから置き換えるため、書き込み中に
+        クラッシュしても設定ファイルが壊れない。毎回シリアライズし、
+        内容が前回保存時と同じ場合だけ書き込みを省略する。
+        
         Returns:
             bool: 保存成功時True
         """
         try:
-            # 設定ディレクトリを作成（存在しない場合）
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+            with self._save_lock:
+                payload = _json_dumps(self.config_data)
+                payload_hash = hashlib.blake2b(payload).digest()
+                if payload_hash == self._last_saved_hash and self.config_file.exists():
+                    # 内容が前回保存時と同じ
+                    self._dirty = False
+                    logger.debug("設定に変更がないため保存をスキップしました")
+                    return True
+                
+                # 設定ディレクトリを作成（存在しない場合）
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                tmp_file = self.config_file.with_suffix('.json.tmp')
+                tmp_file.write_bytes(payload)
+                os.replace(tmp_file, self.config_file)
+                self._last_saved_hash = payload_hash
+                self._last_mtime_ns = self.config_file.stat().st_mtime_ns
+                self._dirty = False
             
-            logger.info(f"設定ファイルを保存しました: {self.config_file}")
+            logger.info("設定ファイルを保存しました: {}", self.config_file)
             return True
             
         except Exception as e:
-            logger.error(f"設定ファイルの保存に失敗: {e}")
+            logger.error("設定ファイルの保存に失敗: {}", e)
             return False
     
     def _get_default_config(self) -> Dict[str, Any]:
         """
         デフォルト設定を取得
         
+        呼び出しごとにテンプレートのバイト列から新しい辞書を作るため、
+        戻り値を書き換えても他の呼び出し元には影響しない。
+        
         Returns:
             Dict[str, Any]: デフォルト設定辞書
         """
-        return {
-            "ui": {
-                "window_width": 1200,
-                "window_height": 800,
-                "window_x": -1,  # -1は中央配置を意味
-                "window_y": -1,
-                "theme": "default",
-                "font_size": 10,
-                "log_lines": 100
-            },
-            "spreadsheet": {
-                "last_url": "",
-                "last_sheet": "",
-                "auto_load": False
-            },
-            "ai_settings": {
-                "ChatGPT": {
-                    "enabled": False,
-                    "model": "gpt-4o",
-                    "settings": {
-                        "temperature": 0.7,
-                        "max_tokens": 2000
-                    }
-                },
-                "Claude": {
-                    "enabled": False,
-                    "model": "claude-3-5-sonnet-20241022",
-                    "settings": {
-                        "max_tokens": 4000
-                    }
-                },
-                "Gemini": {
-                    "enabled": False,
-                    "model": "gemini-2.0-flash-exp",
-                    "settings": {
-                        "temperature": 0.9,
-                        "max_output_tokens": 2048
-                    }
-                },
-                "Genspark": {
-                    "enabled": False,
-                    "model": "genspark-latest",
-                    "settings": {}
-                },
-                "Google AI Studio": {
-                    "enabled": False,
-                    "model": "gemini-2.0-flash-exp",
-                    "settings": {
-                        "temperature": 0.9,
-                        "max_output_tokens": 2048,
-                        "safety_settings": "moderate"
-                    }
-                }
-            },
-            "processing": {
-                "retry_count": 5,
-                "retry_delay": 10,
-                "timeout": 300,
-                "parallel_processing": False
-            },
-            "logging": {
-                "level": "INFO",
-                "max_log_files": 10,
-                "max_log_size_mb": 10
-            }
-        }
+        return _json_loads(_DEFAULT_CONFIG_BYTES)
+    
+    def _update_section(self, section: str, values: Dict[str, Any]):
+        """
+        セクションの設定を部分的に更新
+        
+        Args:
+            section: セクション名（例: "ui"）
+            values: 上書きする設定値
+        """
+        data = self.config_data
+        section_data = data.get(section)
+        if section_data is None:
+            section_data = data[section] = {}
+        section_data.update(values)
+        self._mark_changed()
+    
+    def _section_view(self, key: str) -> Mapping[str, Any]:
+        """
+        セクションの読み取り専用ビューを取得
+        
+        ビューは設定辞書をそのまま参照するため set_config などによる変更も反映されるが、
+        ビューを通じた書き換えはできない（変更は set_config / set_*_config で行う）。
+        
+        Args:
+            key: セクションのキー（ドット記法対応。例: "ai_settings.ChatGPT"）
+            
+        Returns:
+            Mapping[str, Any]: 読み取り専用ビュー（セクションがない場合は空のマッピング）
+        """
+        section = self.get_config(key)
+        if isinstance(section, MappingProxyType):
+            return section
+        return _EMPTY_SECTION
     
-    def get_ui_config(self) -> Dict[str, Any]:
+    def get_ui_config(self) -> Mapping[str, Any]:
         """UI設定を取得"""
-        return self.config_data.get("ui", {})
+        return self._section_view("ui")
     
     def set_ui_config(self, ui_config: Dict[str, Any]):
         """UI設定を設定"""
-        if "ui" not in self.config_data:
-            self.config_data["ui"] = {}
-        self.config_data["ui"].update(ui_config)
+        self._update_section("ui", ui_config)
     
-    def get_spreadsheet_config(self) -> Dict[str, Any]:
+    def get_spreadsheet_config(self) -> Mapping[str, Any]:
         """スプレッドシート設定を取得"""
-        return self.config_data.get("spreadsheet", {})
+        return self._section_view("spreadsheet")
     
     def set_spreadsheet_config(self, spreadsheet_config: Dict[str, Any]):
         """スプレッドシート設定を設定"""
-        if "spreadsheet" not in self.config_data:
-            self.config_data["spreadsheet"] = {}
-        self.config_data["spreadsheet"].update(spreadsheet_config)
+        self._update_section("spreadsheet", spreadsheet_config)
     
-    def get_ai_config(self, ai_name: str) -> Dict[str, Any]:
+    def get_ai_config(self, ai_name: str) -> Mapping[str, Any]:
         """
         特定のAIの設定を取得
         
@@ -184,9 +337,9 @@ class ConfigManager:
             ai_name: AI名
             
         Returns:
-            AI設定辞書
+            AI設定の読み取り専用ビュー（未設定の場合は空のマッピング）
         """
-        return self.config_data.get("ai_settings", {}).get(ai_name, {})
+        return self._section_view(f"ai_settings.{ai_name}")
     
     def set_ai_config(self, ai_name: str, config: Dict[str, Any]):
         """
@@ -199,47 +352,60 @@ class ConfigManager:
         if "ai_settings" not in self.config_data:
             self.config_data["ai_settings"] = {}
         self.config_data["ai_settings"][ai_name] = config
+        self._mark_changed()
     
-    def get_ai_settings(self) -> Dict[str, Any]:
+    def get_ai_settings(self) -> Mapping[str, Any]:
         """AIツール設定を取得（互換性のため）"""
-        return self.config_data.get("ai_settings", {})
+        return self._section_view("ai_settings")
     
     def set_ai_settings(self, ai_settings: Dict[str, Any]):
         """AIツール設定を設定（互換性のため）"""
-        if "ai_settings" not in self.config_data:
-            self.config_data["ai_settings"] = {}
-        self.config_data["ai_settings"].update(ai_settings)
+        self._update_section("ai_settings", ai_settings)
     
-    def get_processing_config(self) -> Dict[str, Any]:
+    def get_processing_config(self) -> Mapping[str, Any]:
         """処理設定を取得"""
-        return self.config_data.get("processing", {})
+        return self._section_view("processing")
     
     def set_processing_config(self, processing_config: Dict[str, Any]):
         """処理設定を設定"""
-        if "processing" not in self.config_data:
-            self.config_data["processing"] = {}
-        self.config_data["processing"].update(processing_config)
+        self._update_section("processing", processing_config)
     
     def get_config(self, key: str, default: Any = None) -> Any:
         """
         指定されたキーの設定値を取得
         
+        平坦化インデックスで親の辞書を1回引き、値はその辞書から直接読む。
+        インデックスに無いキーのみ辞書をたどって探す。
+        値が辞書の場合は読み取り専用ビューを返し、呼び出し元が階層を
+        書き換えてインデックスと食い違うことがないようにする。
+        
         Args:
             key: 設定キー（ドット記法対応。例: "ui.window_width"）
             default: デフォルト値
             
         Returns:
-            設定値
+            設定値（辞書の場合は読み取り専用ビュー）
         """
-        keys = key.split('.')
-        data = self.config_data
+        parent_key, _, leaf = key.rpartition('.')
+        if parent_key:
+            flat = self._flat
+            if flat is None:
+                flat = self._rebuild_flat()
+            parent = flat.get(parent_key)
+        else:
+            parent = self.config_data
+        if type(parent) is dict:
+            value = parent.get(leaf, _MISSING)
+            if value is not _MISSING:
+                return MappingProxyType(value) if type(value) is dict else value
         
+        data = self.config_data
         try:
-            for k in keys:
+            for k in _split_key(key):
                 data = data[k]
-            return data
         except (KeyError, TypeError):
             return default
+        return MappingProxyType(data) if type(data) is dict else data
     
     def set_config(self, key: str, value: Any):
         """
@@ -249,17 +415,34 @@ class ConfigManager:
             key: 設定キー（ドット記法対応。例: "ui.window_width"）
             value: 設定値
         """
-        keys = key.split('.')
-        data = self.config_data
+        flat = self._flat
+        created = False
         
-        # 辞書の階層を作成
-        for k in keys[:-1]:
-            if k not in data:
-                data[k] = {}
-            data = data[k]
+        # インデックスがあれば親の階層を1回の参照で取り出す
+        parent_key, _, leaf = key.rpartition('.')
+        data = flat.get(parent_key) if flat is not None and parent_key else None
+        if type(data) is not dict:
+            keys = _split_key(key)
+            leaf = keys[-1]
+            data = self.config_data
+            
+            # 辞書の階層を作成
+            for k in keys[:-1]:
+                child = data.get(k)
+                if child is None:
+                    child = data[k] = {}
+                    created = True
+                data = child
         
         # 最後のキーに値を設定
-        data[keys[-1]] = value
+        old_value = data.get(leaf)
+        data[leaf] = value
+        self._dirty = True
+        
+        # インデックスは途中の階層（辞書）だけを持つため、末端の値の置き換えでは更新不要
+        # 階層が増減する場合だけインデックスを作り直す
+        if created or isinstance(old_value, dict) or isinstance(value, dict):
+            self._flat = None
     
     # エイリアスメソッド（互換性のため）
     def get(self, key_path: str, default: Any = None) -> Any:
@@ -273,6 +456,7 @@ class ConfigManager:
     def reset_to_default(self):
         """設定をデフォルトにリセット"""
         self.config_data = self._get_default_config()
+        self._mark_changed()
         logger.info("設定をデフォルトにリセットしました")
     
     def export_config(self, export_file: str) -> bool:
@@ -286,14 +470,13 @@ class ConfigManager:
             bool: エクスポート成功時True
         """
         try:
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+            Path(export_file).write_bytes(_json_dumps(self.config_data))
             
-            logger.info(f"設定をエクスポートしました: {export_file}")
+            logger.info("設定をエクスポートしました: {}", export_file)
             return True
             
         except Exception as e:
-            logger.error(f"設定のエクスポートに失敗: {e}")
+            logger.error("設定のエクスポートに失敗: {}", e)
             return False
     
     def import_config(self, import_file: str) -> bool:
@@ -307,56 +490,126 @@ class ConfigManager:
             bool: インポート成功時True
         """
         try:
-            with open(import_file, 'r', encoding='utf-8') as f:
-                imported_config = json.load(f)
+            imported_config = _json_loads(Path(import_file).read_bytes())
             
             # 設定をマージ（既存設定を保持しつつ新しい設定を上書き）
             self._merge_config(self.config_data, imported_config)
             
-            logger.info(f"設定をインポートしました: {import_file}")
+            logger.info("設定をインポートしました: {}", import_file)
             return True
             
         except Exception as e:
-            logger.error(f"設定のインポートに失敗: {e}")
+            logger.error("設定のインポートに失敗: {}", e)
             return False
     
+    def _mark_changed(self):
+        """設定の変更を記録する（インデックスを破棄し、次回保存を有効にする）"""
+        self._flat = None
+        self._dirty = True
+    
+    def _rebuild_flat(self) -> Dict[str, Any]:
+        """
+        config_dataから平坦化インデックスを作り直す
+        
+        "ui" や "ai_settings.ChatGPT" のような途中の階層（辞書）だけを登録する。
+        末端の値は登録せず、get_config が親の辞書から毎回読むため、
+        値の写しが古くなることはない。
+        
+        Returns:
+            Dict[str, Any]: 作り直したインデックス（ドット記法キー → 辞書）
+        """
+        flat: Dict[str, Any] = {}
+        stack = [("", self.config_data)]
+        while stack:
+            prefix, node = stack.pop()
+            for k, v in node.items():
+                if isinstance(v, dict):
+                    key = f"{prefix}{k}"
+                    flat[key] = v
+                    stack.append((f"{key}.", v))
+        self._flat = flat
+        return flat
+    
     def _merge_config(self, target: Dict[str, Any], source: Dict[str, Any]):
         """
-        設定辞書を再帰的にマージ
+        設定辞書を深くマージ
+        
+        targetを直接書き換えるため、中間の辞書コピーは作らない。
+        入れ子の辞書は再帰呼び出しではなくスタックでたどる。
         
         Args:
             target: マージ先辞書
             source: マージ元辞書
         """
-        for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._merge_config(target[key], value)
-            else:
-                target[key] = value
+        _isinstance = isinstance
+        _dict = dict
+        stack = [(target, source)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            dst, src = pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if _isinstance(value, _dict) and _isinstance(current, _dict):
+                    push((current, value))
+                else:
+                    dst[key] = value
+        self._mark_changed()
     
     def auto_save(self):
-        """設定を自動保存（エラーが発生しても継続）"""
+        """
+        設定を自動保存（エラーが発生しても継続）
+        
+        AUTO_SAVE_DELAY 秒以内の連続呼び出しは1回の保存にまとめる。
+        """
+        with self._save_lock:
+            if self._auto_save_timer is not None:
+                self._auto_save_timer.cancel()
+            self._auto_save_timer = threading.Timer(AUTO_SAVE_DELAY, self._run_auto_save)
+            self._auto_save_timer.daemon = True
+            self._auto_save_timer.start()
+    
+    def _run_auto_save(self):
+        """デバウンス後に実際の保存を行う"""
+        with self._save_lock:
+            self._auto_save_timer = None
         try:
             self.save_config()
         except Exception as e:
-            logger.warning(f"設定の自動保存に失敗しました: {e}")
+            logger.warning("設定の自動保存に失敗しました: {}", e)
+    
+    def flush(self):
+        """保留中の自動保存があれば即座に書き込む"""
+        with self._save_lock:
+            timer = self._auto_save_timer
+            self._auto_save_timer = None
+        if timer is not None:
+            timer.cancel()
+            self.save_config()
 
 
 # グローバルConfigManagerインスタンス
 _config_manager_instance: Optional[ConfigManager] = None
+_config_manager_lock = threading.Lock()
 
 
 def get_config_manager() -> ConfigManager:
     """
     ConfigManagerのシングルトンインスタンスを取得
     
+    複数スレッドから同時に呼ばれてもインスタンスが1つだけになるよう、
+    ダブルチェックロックで生成する。設定ファイルの読み込みは
+    最初に設定へアクセスするまで行わない。
+    
     Returns:
         ConfigManager: ConfigManagerインスタンス
     """
     global _config_manager_instance
     
     if _config_manager_instance is None:
-        _config_manager_instance = ConfigManager()
+        with _config_manager_lock:
+            if _config_manager_instance is None:
+                _config_manager_instance = ConfigManager()
     
     return _config_manager_instance
 
@@ -364,4 +617,9 @@ def get_config_manager() -> ConfigManager:
 def reset_config_manager():
     """ConfigManagerインスタンスをリセット（主にテスト用）"""
     global _config_manager_instance
-    _config_manager_instance = None
\ No newline at end of file
+    with _config_manager_lock:
+        if _config_manager_instance is not None:
+            # 保留中の自動保存を書き込み、終了時の書き込み登録を外す
+            _config_manager_instance.flush()
+            atexit.unregister(_config_manager_instance.flush)
+        _config_manager_instance = None
\ No newline at end of file
@@ -6,6 +6,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import asyncio
+import collections
+from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 from pathlib import Path
 
@@ -22,15 +24,33 @@ from src.interfaces.gui_interface import IGUIController, ProcessStatus
 
 logger = get_logger(__name__)
 
+# ログ表示をまとめて更新する間隔（ミリ秒）
+LOG_FLUSH_INTERVAL_MS = 50
+
+# ステータスバーに表示する文言
+_STATUS_TEXT = {
+    ProcessStatus.IDLE: "待機中",
+    ProcessStatus.PROCESSING: "処理中",
+    ProcessStatus.PAUSED: "一時停止",
+    ProcessStatus.COMPLETED: "完了",
+    ProcessStatus.ERROR: "エラー"
+}
+
 
 class CopyColumnAISelector(ttk.Frame):
     """コピー列ごとのAI選択ウィジェット"""
     
     def __init__(self, parent, copy_columns: List[int], ai_tools: List[str]):
         super().__init__(parent)
-        self.copy_columns = copy_columns
-        self.ai_tools = ai_tools
+        self.copy_columns = list(copy_columns)
+        self.ai_tools = list(ai_tools)
         self.column_ai_mapping = {}
+        # 列ごとの選択値（StringVarの変更をtraceで反映し、取得時にTclを呼ばない）
+        self._selected_ai: Dict[int, str] = {}
+        # 列番号 → [ラベル, コンボボックス, StringVar, traceのID, 配置行]
+        self._rows: Dict[int, list] = {}
+        # 使わなくなった行（次に列が増えたときに再利用する）
+        self._free_rows: List[tuple] = []
         
         self._create_widgets()
         
@@ -41,28 +61,95 @@ class CopyColumnAISelector(ttk.Frame):
             row=0, column=0, columnspan=3, pady=(0, 10), sticky=tk.W
         )
         
+        # デフォルト設定ボタン
+        self._set_all_button = ttk.Button(self, text="全て同じAIに設定", 
+                                          command=self._set_all_same)
+        
         # 列ごとの選択UI
+        self._layout_rows()
+        
+    def _layout_rows(self):
+        """列ごとの選択行を配置（位置が変わらない行は触らない）"""
         for i, col_idx in enumerate(self.copy_columns):
             row = i + 1
+            entry = self._rows.get(col_idx)
+            if entry is None:
+                entry = self._acquire_row(col_idx)
+            elif entry[4] == row:
+                continue
+            
+            label, combo = entry[0], entry[1]
+            label.grid(row=row, column=0, padx=(0, 10), pady=2, sticky=tk.W)
+            combo.grid(row=row, column=1, pady=2)
+            entry[4] = row
             
+        self._set_all_button.grid(
+            row=len(self.copy_columns) + 1, column=0, columnspan=2, pady=10
+        )
+        
+    def _acquire_row(self, col_idx: int) -> list:
+        """列用の選択行を用意する（空き行があれば再利用）"""
+        default_ai = self.ai_tools[0] if self.ai_tools else ""
+        if self._free_rows:
+            label, combo, ai_var = self._free_rows.pop()
+            label.config(text=f"列 {col_idx + 1}:")
+            combo.config(values=self.ai_tools)
+            ai_var.set(default_ai)
+        else:
             # 列番号
-            ttk.Label(self, text=f"列 {col_idx + 1}:").grid(
-                row=row, column=0, padx=(0, 10), pady=2, sticky=tk.W
-            )
+            label = ttk.Label(self, text=f"列 {col_idx + 1}:")
             
             # AI選択コンボボックス
-            ai_var = tk.StringVar(value=self.ai_tools[0] if self.ai_tools else "")
+            ai_var = tk.StringVar(value=default_ai)
             combo = ttk.Combobox(self, textvariable=ai_var, values=self.ai_tools,
                                state="readonly", width=20)
-            combo.grid(row=row, column=1, pady=2)
-            
-            self.column_ai_mapping[col_idx] = ai_var
-            
-        # デフォルト設定ボタン
-        ttk.Button(self, text="全て同じAIに設定", 
-                  command=self._set_all_same).grid(
-            row=len(self.copy_columns) + 1, column=0, columnspan=2, pady=10
+        
+        self.column_ai_mapping[col_idx] = ai_var
+        self._selected_ai[col_idx] = ai_var.get()
+        trace_id = ai_var.trace_add(
+            'write',
+            lambda *_, c=col_idx, v=ai_var: self._selected_ai.__setitem__(c, v.get())
         )
+        entry = [label, combo, ai_var, trace_id, None]
+        self._rows[col_idx] = entry
+        return entry
+        
+    def update_columns(self, copy_columns: List[int], ai_tools: List[str]):
+        """
+        列とAIの候補を更新
+        
+        ウィジェットを作り直さず、増減した行だけを追加・撤去する。
+        残った列の選択は、新しい候補に含まれていれば維持する。
+        
+        Args:
+            copy_columns: コピー列のインデックス
+            ai_tools: 選択可能なAI名
+        """
+        ai_tools = list(ai_tools)
+        ai_tools_changed = ai_tools != self.ai_tools
+        self.copy_columns = list(copy_columns)
+        self.ai_tools = ai_tools
+        
+        # 不要になった行を撤去して空き行に回す
+        wanted = set(self.copy_columns)
+        for col_idx in [c for c in self._rows if c not in wanted]:
+            label, combo, ai_var, trace_id, _ = self._rows.pop(col_idx)
+            ai_var.trace_remove('write', trace_id)
+            label.grid_forget()
+            combo.grid_forget()
+            self._free_rows.append((label, combo, ai_var))
+            del self.column_ai_mapping[col_idx]
+            self._selected_ai.pop(col_idx, None)
+        
+        # AIの候補が変わった場合のみ既存行のコンボボックスを更新
+        if ai_tools_changed:
+            default_ai = ai_tools[0] if ai_tools else ""
+            for col_idx, entry in self._rows.items():
+                entry[1].config(values=ai_tools)
+                if self._selected_ai.get(col_idx) not in ai_tools:
+                    entry[2].set(default_ai)
+        
+        self._layout_rows()
         
     def _set_all_same(self):
         """全列を同じAIに設定"""
@@ -93,7 +180,7 @@ class CopyColumnAISelector(ttk.Frame):
         
     def get_mapping(self) -> Dict[int, str]:
         """列とAIのマッピングを取得"""
-        return {col: var.get() for col, var in self.column_ai_mapping.items()}
+        return dict(self._selected_ai)
 
 
 class EnhancedMainWindow(IGUIController):
@@ -115,15 +202,35 @@ class EnhancedMainWindow(IGUIController):
         self.detected_copy_columns = []
         self.column_ai_selector = None
         
+        # 非同期処理用のイベントループ（ウィンドウと同じ期間だけ使い回す）
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
+        self._loop_thread.start()
+        
+        # ワーカースレッドから届いたログの一時バッファ（UIスレッドでまとめて表示）
+        self._log_buffer = collections.deque(maxlen=10000)
+        self._log_lock = threading.Lock()
+        
         # ウィジェット作成
         self._create_widgets()
         self._layout_widgets()
         
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_logs)
+        
         # ウィンドウクローズ時の処理
         self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
         
         logger.info("拡張版メインウィンドウを初期化しました")
         
+    def _run_event_loop(self):
+        """バックグラウンドスレッドでイベントループを回し続ける"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        
+    def _submit(self, coro) -> "asyncio.Future":
+        """コルーチンを共有イベントループで実行する"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+        
     def _create_widgets(self):
         """ウィジェットを作成"""
         self.main_frame = ttk.Frame(self.root, padding="10")
@@ -241,24 +348,38 @@ class EnhancedMainWindow(IGUIController):
         self.main_frame.rowconfigure(0, weight=1)
         
     def _refresh_chrome_profiles(self):
-        """Chromeプロファイルリストを更新"""
+        """
+        Chromeプロファイルリストを更新
+        
+        プロファイル情報の読み込み（Playwrightのimportとディスク読み込み）は
+        バックグラウンドスレッドで行い、結果だけをUIスレッドで反映する。
+        """
+        self.profile_combo.set("読み込み中...")
+        thread = threading.Thread(target=self._load_chrome_profiles, daemon=True)
+        thread.start()
+        
+    def _load_chrome_profiles(self):
+        """Chromeプロファイル情報を読み込む（バックグラウンドスレッド）"""
         try:
             from src.ai_tools.browser_manager import BrowserManager
             temp_manager = BrowserManager()
             profiles = temp_manager.get_available_profiles_info()
             
-            profile_names = []
-            for profile in profiles:
-                name = profile.get('name', profile.get('dir', 'Unknown'))
-                dir_name = profile.get('dir', '')
-                profile_names.append(dir_name)
-                
-            self.profile_combo['values'] = profile_names
-            if profile_names:
-                self.profile_combo.set(profile_names[0])
+            profile_names = [profile.get('dir', '') for profile in profiles]
                 
         except Exception as e:
             logger.error(f"プロファイル取得エラー: {e}")
+            profile_names = []
+            
+        self.root.after(0, self._apply_chrome_profiles, profile_names)
+        
+    def _apply_chrome_profiles(self, profile_names: List[str]):
+        """読み込んだプロファイル一覧をコンボボックスに反映"""
+        self.profile_combo['values'] = profile_names
+        if profile_names:
+            self.profile_combo.set(profile_names[0])
+        else:
+            self.profile_combo.set("")
             
     def _detect_columns(self):
         """コピー列を検出"""
@@ -267,11 +388,8 @@ class EnhancedMainWindow(IGUIController):
             messagebox.showwarning("警告", "スプレッドシートとシートを選択してください")
             return
             
-        # 非同期で列検出を実行
+        # バックグラウンドで列検出を実行（同期APIのみのためイベントループは不要）
         def detect_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
             try:
                 # シートデータを取得して列を検出
                 from src.sheets.client import GoogleSheetsClient
@@ -311,39 +429,38 @@ class EnhancedMainWindow(IGUIController):
             except Exception as e:
                 logger.error(f"列検出エラー: {e}")
                 self.add_log(f"列検出エラー: {e}", "ERROR")
-            finally:
-                loop.close()
                 
         thread = threading.Thread(target=detect_async, daemon=True)
         thread.start()
         
     def _update_column_selector(self):
         """コピー列セレクターを更新"""
-        # 既存のセレクターを削除
-        if self.column_ai_selector:
-            self.column_ai_selector.destroy()
-            
         # 有効なAIツールを取得
-        ai_configs = self.ai_config_panel.get_all_configs()
-        enabled_ais = [name for name, config in ai_configs.items() 
-                      if config.get('enabled', False)]
-        
-        if not enabled_ais:
-            self.column_info_label.config(text="有効なAIツールがありません")
-            return
-            
-        if not self.detected_copy_columns:
-            self.column_info_label.config(text="コピー列が検出されていません")
+        enabled_ais = list(self.ai_config_panel.get_enabled_names())
+        
+        if not enabled_ais or not self.detected_copy_columns:
+            # 既存のセレクターは隠すだけにして、次回の更新で再利用する
+            if self.column_ai_selector:
+                self.column_ai_selector.pack_forget()
+            if not enabled_ais:
+                self.column_info_label.config(text="有効なAIツールがありません")
+            else:
+                self.column_info_label.config(text="コピー列が検出されていません")
+            self.column_info_label.pack()
             return
             
         self.column_info_label.pack_forget()
         
-        # 新しいセレクターを作成
-        self.column_ai_selector = CopyColumnAISelector(
-            self.column_frame,
-            self.detected_copy_columns,
-            enabled_ais
-        )
+        if self.column_ai_selector is None:
+            # 新しいセレクターを作成
+            self.column_ai_selector = CopyColumnAISelector(
+                self.column_frame,
+                self.detected_copy_columns,
+                enabled_ais
+            )
+        else:
+            # 既存のセレクターの行を差分更新
+            self.column_ai_selector.update_columns(self.detected_copy_columns, enabled_ais)
         self.column_ai_selector.pack(fill=tk.BOTH, expand=True)
         
     def _start_processing(self):
@@ -354,11 +471,7 @@ class EnhancedMainWindow(IGUIController):
             messagebox.showwarning("警告", "スプレッドシートとシートを選択してください")
             return
             
-        ai_configs = self.ai_config_panel.get_all_configs()
-        enabled_ais = [name for name, config in ai_configs.items() 
-                      if config.get('enabled', False)]
-        
-        if not enabled_ais:
+        if not self.ai_config_panel.get_enabled_names():
             messagebox.showwarning("警告", "少なくとも1つのAIを有効にしてください")
             return
             
@@ -366,6 +479,8 @@ class EnhancedMainWindow(IGUIController):
             messagebox.showwarning("警告", "先に「列を検出」を実行してください")
             return
             
+        ai_configs = self.ai_config_panel.get_all_configs()
+        
         # コピー列とAIのマッピングを取得
         if self.column_ai_selector:
             column_mapping = self.column_ai_selector.get_mapping()
@@ -385,19 +500,16 @@ class EnhancedMainWindow(IGUIController):
             'chrome_profile': self.profile_var.get()
         }
         
-        # 非同期で処理を実行
-        def process_async():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
+        # 共有イベントループで処理を実行
+        async def process_async():
             try:
                 # 初期化
-                if not loop.run_until_complete(self.orchestrator.initialize(config['chrome_profile'])):
+                if not await self.orchestrator.initialize(config['chrome_profile']):
                     self.add_log("初期化に失敗しました", "ERROR")
                     return
                     
                 # 処理実行
-                loop.run_until_complete(self.orchestrator.process_spreadsheet(config))
+                await self.orchestrator.process_spreadsheet(config)
                 
             except Exception as e:
                 logger.error(f"処理エラー: {e}")
@@ -405,14 +517,11 @@ class EnhancedMainWindow(IGUIController):
                 
             finally:
                 # クリーンアップ
-                loop.run_until_complete(self.orchestrator.cleanup())
-                loop.close()
+                await self.orchestrator.cleanup()
                 
-                # UIを更新
-                self.root.after(0, self._processing_finished)
-                
-        thread = threading.Thread(target=process_async, daemon=True)
-        thread.start()
+        future = self._submit(process_async())
+        # UIを更新
+        future.add_done_callback(lambda _: self.root.after(0, self._processing_finished))
         
     def _stop_processing(self):
         """処理を停止"""
@@ -446,9 +555,7 @@ class EnhancedMainWindow(IGUIController):
         
     def _on_ai_config_changed(self):
         """AI設定変更時の処理"""
-        configs = self.ai_config_panel.get_all_configs()
-        enabled_ais = [name for name, config in configs.items() 
-                      if config.get('enabled', False)]
+        enabled_ais = self.ai_config_panel.get_enabled_names()
         self.add_log(f"AI設定が変更されました: {len(enabled_ais)}個のAIが有効")
         
         # コピー列セレクターを更新
@@ -464,33 +571,19 @@ class EnhancedMainWindow(IGUIController):
                 
         # クリーンアップ
         if hasattr(self, 'orchestrator'):
-            def cleanup_async():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(self.orchestrator.cleanup())
-                except:
-                    pass
-                finally:
-                    loop.close()
-                    
-            thread = threading.Thread(target=cleanup_async)
-            thread.start()
-            thread.join(timeout=5)
-            
+            try:
+                self._submit(self.orchestrator.cleanup()).result(timeout=5)
+            except Exception:
+                pass
+                
+        self._loop.call_soon_threadsafe(self._loop.stop)
         self.root.destroy()
         
     # IGUIControllerインターフェースの実装
     def update_status(self, status: ProcessStatus, message: str = ""):
         """ステータスを更新"""
         self.current_status = status
-        status_text = {
-            ProcessStatus.IDLE: "待機中",
-            ProcessStatus.PROCESSING: "処理中",
-            ProcessStatus.PAUSED: "一時停止",
-            ProcessStatus.COMPLETED: "完了",
-            ProcessStatus.ERROR: "エラー"
-        }.get(status, "不明")
+        status_text = _STATUS_TEXT.get(status, "不明")
         
         if message:
             status_text = f"{status_text} - {message}"
@@ -502,8 +595,25 @@ class EnhancedMainWindow(IGUIController):
         self.progress_widget.update_progress(current, total, message)
         
     def add_log(self, message: str, level: str = "INFO"):
-        """ログを追加"""
-        self.log_widget.add_log(message, level)
+        """
+        ログを追加
+        
+        どのスレッドから呼ばれてもよいよう、ここではバッファに積むだけにして
+        表示は _flush_logs がUIスレッドでまとめて行う。
+        タイムスタンプは反映時ではなく、ここで呼ばれた時刻を記録する。
+        """
+        timestamp = datetime.now()
+        with self._log_lock:
+            self._log_buffer.append((message, level, timestamp))
+        
+    def _flush_logs(self):
+        """バッファに溜まったログをまとめてLogWidgetへ反映する"""
+        with self._log_lock:
+            entries = list(self._log_buffer)
+            self._log_buffer.clear()
+        if entries:
+            self.log_widget.add_logs(entries)
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_logs)
         
     def show_error(self, title: str, message: str):
         """エラーダイアログを表示"""
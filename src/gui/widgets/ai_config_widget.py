@@ -7,7 +7,7 @@ AI設定ウィジェット
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import asyncio
 import threading
 from pathlib import Path
@@ -38,6 +38,8 @@ class AIConfigWidget:
         self.ai_name = ai_name
         self.config = config or {}
         self.cache_dir = cache_dir
+        # 詳細設定など、変数のtraceで拾えない設定変更の通知先
+        self.on_changed: Optional[Callable] = None
         
         # 変数の初期化
         self.enabled_var = tk.BooleanVar()
@@ -93,7 +95,7 @@ class AIConfigWidget:
                 settings = loop.run_until_complete(self.model_fetcher.fetch_settings())
                 
                 # UIスレッドで更新
-                self.parent.after(0, lambda: self._update_models(models, settings))
+                self.parent.after(0, self._update_models, models, settings)
                 
             except Exception as e:
                 logger.error(f"モデル情報取得エラー: {e}")
@@ -289,19 +291,33 @@ class AIConfigWidget:
                     models = loop.run_until_complete(self.model_fetcher.fetch_models(force_refresh=True))
                     settings = loop.run_until_complete(self.model_fetcher.fetch_settings(force_refresh=True))
                     
-                    self.parent.after(0, lambda: self._update_models(models, settings))
-                    self.parent.after(0, lambda: self.status_label.config(text="更新完了", foreground="green"))
+                    # UIスレッドへの受け渡しは1回にまとめる
+                    self.parent.after(0, self._finish_refresh, models, settings)
                     
                 except Exception as e:
                     logger.error(f"モデル情報更新エラー: {e}")
-                    self.parent.after(0, lambda: self.status_label.config(text="更新失敗", foreground="red"))
+                    self.parent.after(0, self._finish_refresh, None, None)
                 finally:
                     loop.close()
-                    self.parent.after(0, lambda: self.refresh_button.config(state=tk.NORMAL))
             
             thread = threading.Thread(target=refresh_in_thread, daemon=True)
             thread.start()
     
+    def _finish_refresh(self, models: Optional[List[ModelInfo]], settings: Optional[List[SettingOption]]):
+        """
+        モデル情報再取得完了時のUI更新
+        
+        Args:
+            models: 取得したモデル一覧（失敗時None）
+            settings: 取得した設定項目（失敗時None）
+        """
+        if models is not None:
+            self._update_models(models, settings)
+            self.status_label.config(text="更新完了", foreground="green")
+        else:
+            self.status_label.config(text="更新失敗", foreground="red")
+        self.refresh_button.config(state=tk.NORMAL)
+    
     def _update_tooltip(self, widget, text):
         """ウィジェットにツールチップを設定"""
         # 簡易的なツールチップ実装
@@ -331,6 +347,7 @@ class AIConfigWidget:
         )
         if dialog.result:
             self.config['settings'] = dialog.result
+            self._notify_changed()
             logger.info(f"{self.ai_name}の詳細設定を更新しました")
     
     def _load_config(self):
@@ -358,6 +375,12 @@ class AIConfigWidget:
         """設定を外部から設定"""
         self.config = config
         self._load_config()
+        self._notify_changed()
+    
+    def _notify_changed(self):
+        """設定変更を通知"""
+        if self.on_changed:
+            self.on_changed()
 
 
 class AdvancedSettingsDialog:
@@ -620,6 +643,10 @@ class AIConfigPanel:
         self.on_config_changed = on_config_changed
         self.cache_dir = cache_dir or Path.home() / ".ai_tools_cache"
         self.ai_widgets: Dict[str, AIConfigWidget] = {}
+        # 有効なAI名のキャッシュ（使用チェックボックスが変わるとNoneに戻す）
+        self._enabled_cache: Optional[Tuple[str, ...]] = None
+        # 全AI設定のキャッシュ（いずれかの設定が変わるとNoneに戻す）
+        self._configs_cache: Optional[Dict[str, Dict[str, Any]]] = None
         
         self._create_widgets()
         self._create_ai_widgets()
@@ -664,7 +691,21 @@ class AIConfigPanel:
         for i, ai_name in enumerate(settings.SUPPORTED_AI_TOOLS):
             widget = AIConfigWidget(self.scrollable_frame, ai_name, cache_dir=self.cache_dir)
             widget.frame.pack(fill=tk.X, pady=2)
+            widget.enabled_var.trace_add('write', self._invalidate_enabled_cache)
+            widget.model_var.trace_add('write', self._invalidate_configs_cache)
+            widget.on_changed = self._invalidate_configs_cache
             self.ai_widgets[ai_name] = widget
+        self._enabled_cache = None
+        self._configs_cache = None
+    
+    def _invalidate_enabled_cache(self, *args):
+        """有効なAI名のキャッシュを破棄（全AI設定のキャッシュも破棄）"""
+        self._enabled_cache = None
+        self._configs_cache = None
+    
+    def _invalidate_configs_cache(self, *args):
+        """全AI設定のキャッシュを破棄"""
+        self._configs_cache = None
     
     def _refresh_all_models(self):
         """全AIのモデル情報を更新"""
@@ -672,11 +713,39 @@ class AIConfigPanel:
             widget._refresh_models()
     
     def get_all_configs(self) -> Dict[str, Dict[str, Any]]:
-        """全AI設定を取得"""
-        configs = {}
-        for ai_name, widget in self.ai_widgets.items():
-            configs[ai_name] = widget.get_config()
-        return configs
+        """
+        全AI設定を取得
+        
+        いずれかのAIの設定が変わるまでは前回読み取った内容を返す。
+        
+        Returns:
+            AI名 → 設定辞書
+        """
+        configs = self._configs_cache
+        if configs is None:
+            configs = {}
+            for ai_name, widget in self.ai_widgets.items():
+                configs[ai_name] = widget.get_config()
+            self._configs_cache = configs
+        return dict(configs)
+    
+    def get_enabled_names(self) -> Tuple[str, ...]:
+        """
+        有効になっているAI名を取得
+        
+        使用チェックボックスが変わるまでは前回の結果を返す。
+        
+        Returns:
+            有効なAI名のタプル
+        """
+        enabled = self._enabled_cache
+        if enabled is None:
+            enabled = tuple(
+                ai_name for ai_name, widget in self.ai_widgets.items()
+                if widget.enabled_var.get()
+            )
+            self._enabled_cache = enabled
+        return enabled
     
     def set_all_configs(self, configs: Dict[str, Dict[str, Any]]):
         """全AI設定を外部から設定"""
@@ -143,13 +143,25 @@ class ColumnAIConfigWidget:
             for ai_name in self.available_ais:
                 self._load_models_for_ai(ai_name)
             
-            # UIを更新
-            self.parent.after(0, self._update_model_list)
-            self.parent.after(0, lambda: self.status_label.config(text="準備完了"))
+            # UIを更新（UIスレッドへの受け渡しは1回にまとめる）
+            self.parent.after(0, self._finish_initial_load, True)
             
         except Exception as e:
             logger.error(f"モデル読み込み失敗: {e}")
-            self.parent.after(0, lambda: self.status_label.config(text="エラー", foreground="red"))
+            self.parent.after(0, self._finish_initial_load, False)
+    
+    def _finish_initial_load(self, success: bool):
+        """
+        初期モデル読み込み完了時のUI更新
+        
+        Args:
+            success: 読み込みに成功した場合True
+        """
+        if success:
+            self._update_model_list()
+            self.status_label.config(text="準備完了")
+        else:
+            self.status_label.config(text="エラー", foreground="red")
     
     def _load_models_for_ai(self, ai_name: str):
         """指定AIのモデル一覧を読み込み"""
@@ -286,15 +298,26 @@ class ColumnAIConfigWidget:
             # Playwrightでモデル取得（実装は後で詳細化）
             self._fetch_latest_models_with_playwright(selected_ai)
             
-            # UI更新
-            self.parent.after(0, self._update_model_list)
-            self.parent.after(0, lambda: self.status_label.config(text="更新完了", foreground="green"))
-            self.parent.after(0, lambda: self.refresh_button.config(state=tk.NORMAL, text="最新モデル取得"))
+            # UI更新（UIスレッドへの受け渡しは1回にまとめる）
+            self.parent.after(0, self._finish_refresh, True)
             
         except Exception as e:
             logger.error(f"モデル更新失敗: {e}")
-            self.parent.after(0, lambda: self.status_label.config(text="更新失敗", foreground="red"))
-            self.parent.after(0, lambda: self.refresh_button.config(state=tk.NORMAL, text="最新モデル取得"))
+            self.parent.after(0, self._finish_refresh, False)
+    
+    def _finish_refresh(self, success: bool):
+        """
+        最新モデル取得完了時のUI更新
+        
+        Args:
+            success: 取得に成功した場合True
+        """
+        if success:
+            self._update_model_list()
+            self.status_label.config(text="更新完了", foreground="green")
+        else:
+            self.status_label.config(text="更新失敗", foreground="red")
+        self.refresh_button.config(state=tk.NORMAL, text="最新モデル取得")
     
     def _fetch_latest_models_with_playwright(self, ai_name: str):
         """Playwrightで最新モデル情報を取得"""
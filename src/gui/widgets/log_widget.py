@@ -9,7 +9,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from datetime import datetime
 import re
-from typing import List, Optional, Callable
+from typing import Iterable, List, Optional, Callable, Tuple
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -158,6 +158,42 @@ class LogWidget:
             level: ログレベル
             timestamp: タイムスタンプ（省略時は現在時刻）
         """
+        self._append_entry(message, level, timestamp)
+        self._trim_entries()
+        
+        # フィルター更新
+        self._update_filtered_entries()
+        
+        # 表示更新
+        self._update_display()
+        
+        logger.debug(f"ログエントリを追加: [{level}] {message}")
+    
+    def add_logs(self, entries: Iterable[Tuple[str, str, Optional[datetime]]]):
+        """
+        複数のログエントリをまとめて追加
+        
+        フィルターと表示の更新は最後に1回だけ行う。
+        
+        Args:
+            entries: (メッセージ, ログレベル, タイムスタンプ) のタプルの並び
+                （タイムスタンプがNoneの場合は現在時刻）
+        """
+        count = 0
+        for message, level, timestamp in entries:
+            self._append_entry(message, level, timestamp)
+            count += 1
+        if not count:
+            return
+        self._trim_entries()
+        
+        self._update_filtered_entries()
+        self._update_display()
+        
+        logger.debug(f"ログエントリを{count}件まとめて追加")
+    
+    def _append_entry(self, message: str, level: str, timestamp: Optional[datetime]):
+        """ログエントリを作成して末尾に追加"""
         if level not in self.LOG_LEVELS:
             level = "INFO"
         
@@ -174,18 +210,11 @@ class LogWidget:
         
         # ログエントリを追加
         self.log_entries.append(log_entry)
-        
-        # 最大行数を超えた場合、古いエントリを削除
+    
+    def _trim_entries(self):
+        """最大行数を超えた場合、古いエントリを削除"""
         if len(self.log_entries) > self.max_lines:
             self.log_entries = self.log_entries[-self.max_lines:]
-        
-        # フィルター更新
-        self._update_filtered_entries()
-        
-        # 表示更新
-        self._update_display()
-        
-        logger.debug(f"ログエントリを追加: [{level}] {message}")
     
     def _on_level_changed(self, event=None):
         """ログレベルフィルター変更時の処理"""
@@ -0,0 +1,103 @@
+import json
+import os
+
+import pytest
+
+from src.config_manager import ConfigManager
+
+
+class TestConfigManager:
+    """ConfigManagerのテストクラス"""
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        return tmp_path / "user_settings.json"
+
+    @pytest.fixture
+    def manager(self, config_file):
+        return ConfigManager(str(config_file))
+
+    def test_section_view_is_read_only(self, manager):
+        """セクションのビューを通じた書き換えはできない"""
+        ui_config = manager.get_ui_config()
+
+        with pytest.raises(TypeError):
+            ui_config['theme'] = 'dark'
+
+        assert manager.get_config('ui.theme') == 'default'
+
+    def test_set_config_is_visible_through_views(self, manager):
+        """set_configの変更が取得済みのビューとget_configに反映される"""
+        ui_config = manager.get_ui_config()
+
+        manager.set_config('ui.window_width', 5)
+
+        assert ui_config['window_width'] == 5
+        assert manager.get_config('ui.window_width') == 5
+
+    def test_nested_dict_edit_is_read_and_saved(self, manager, config_file):
+        """ビューの中の辞書を書き換えた場合もget_configとsave_configに反映される"""
+        assert manager.save_config()
+
+        manager.get_ai_config('ChatGPT')['settings']['temperature'] = 0.1
+
+        assert manager.get_config('ai_settings.ChatGPT.settings.temperature') == 0.1
+        assert manager.save_config()
+        saved = json.loads(config_file.read_text(encoding='utf-8'))
+        assert saved['ai_settings']['ChatGPT']['settings']['temperature'] == 0.1
+
+    def test_replacing_a_section_updates_lookups(self, manager):
+        """階層ごと置き換えた後もドット記法の取得が新しい値を返す"""
+        assert manager.get_config('ai_settings.ChatGPT.model') == 'gpt-4o'
+
+        manager.set_config('ai_settings.ChatGPT', {'model': 'o1-mini'})
+
+        assert manager.get_config('ai_settings.ChatGPT.model') == 'o1-mini'
+        assert manager.get_config('ai_settings.ChatGPT.settings.temperature', 'none') == 'none'
+
+    def test_write_then_reload(self, manager, config_file):
+        """保存した設定が別インスタンスの読み込みで復元される"""
+        manager.set_config('spreadsheet.last_url', 'https://example.com/sheet')
+        manager.set_ui_config({'theme': 'dark'})
+        assert manager.save_config()
+
+        reloaded = ConfigManager(str(config_file))
+
+        assert reloaded.get_config('spreadsheet.last_url') == 'https://example.com/sheet'
+        assert reloaded.get_ui_config()['theme'] == 'dark'
+        # 保存されていない項目はデフォルト値で補われる
+        assert reloaded.get_config('processing.retry_count') == 5
+
+    def test_reload_picks_up_external_changes(self, manager, config_file):
+        """設定ファイルが外部で更新された場合は読み直す"""
+        assert manager.save_config()
+
+        saved = json.loads(config_file.read_text(encoding='utf-8'))
+        saved['ui']['font_size'] = 14
+        config_file.write_text(json.dumps(saved), encoding='utf-8')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert manager.load_config()
+        assert manager.get_config('ui.font_size') == 14
+
+    def test_save_skips_identical_content(self, manager, config_file):
+        """内容が前回保存時と同じ場合はファイルを書き換えない"""
+        assert manager.save_config()
+        mtime_ns = config_file.stat().st_mtime_ns
+
+        manager.set_config('ui.theme', 'default')
+        assert manager.save_config()
+
+        assert config_file.stat().st_mtime_ns == mtime_ns
+
+    def test_flush_writes_pending_auto_save(self, manager, config_file):
+        """保留中の自動保存はflushで即座に書き込まれる"""
+        manager.set_config('ui.log_lines', 250)
+        manager.auto_save()
+
+        manager.flush()
+
+        saved = json.loads(config_file.read_text(encoding='utf-8'))
+        assert saved['ui']['log_lines'] == 250
+        assert not config_file.with_suffix('.json.tmp').exists()